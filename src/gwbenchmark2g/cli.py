@@ -3,10 +3,11 @@
 import argparse
 from pathlib import Path
 
+import h5py
 import numpy as np
 import yaml
 
-from .io import save_metadata
+from .io import ROW_GROUP_SIZE, JsonMetadataWriter, MetadataWriter
 
 
 def get_parser():
@@ -31,12 +32,42 @@ def get_parser():
         default=Path("."),
         help="Output directory for the generated dataset.",
     )
+    parser.add_argument(
+        "--n-workers",
+        type=int,
+        default=1,
+        help="Number of worker processes to simulate with.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("parquet", "jsonl"),
+        default="parquet",
+        help="Storage format for the injection metadata.",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=ROW_GROUP_SIZE,
+        help="Number of metadata records per parquet row group.",
+    )
+    parser.add_argument(
+        "--compression",
+        type=str,
+        default="zstd",
+        help="Compression codec for the metadata parquet file.",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=1,
+        help="Compression level for the metadata parquet file.",
+    )
     return parser
 
 
 def main():
     from .config import level_registry
-    from .simulate import simulate_registry
+    from .simulate import simulate_parallel, simulate_registry
 
     parser = get_parser()
     args = parser.parse_args()
@@ -44,7 +75,10 @@ def main():
     LevelConfigClass = level_registry[args.level]
 
     with open(args.config) as f:
-        config_data = yaml.safe_load(f)
+        # use the libyaml C parser when available, it is ~10x faster
+        config_data = yaml.load(
+            f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        )
 
     config = LevelConfigClass.model_validate(config_data)
 
@@ -53,15 +87,50 @@ def main():
     if simulate_function is None:
         raise ValueError(f"No simulation function found for level {args.level}")
 
-    all_metadata = list()
+    if args.n_workers > 1:
+        simulations = simulate_parallel(simulate_function, config, args.n_workers)
+    else:
+        simulations = simulate_function(config)
 
     # Create output directory if it doesn't exist
     output_dir = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save data to .npy file and metadata to a parquet file
-    for ii, (data, metadata) in enumerate(simulate_function(config)):
-        all_metadata.append(metadata)
-        np.savez(output_dir / f"simulation_{ii}.npz", data=data)
-
-    save_metadata(all_metadata, output_dir / "injection_metadata.parquet")
+    # Stream strain into one HDF5 store (a single appendable file instead
+    # of one .npz per simulation) and metadata to a parquet file, one row
+    # group at a time, so memory stays bounded for large runs
+    if args.format == "jsonl":
+        writer = JsonMetadataWriter(output_dir / "injection_metadata.jsonl")
+    else:
+        writer = MetadataWriter(
+            output_dir / "injection_metadata.parquet",
+            row_group_size=args.row_group_size,
+            detectors=config.detectors,
+            compression=args.compression,
+            compression_level=args.compression_level,
+        )
+
+    with writer, h5py.File(output_dir / "strain.h5", "w") as store:
+        strain_dataset = None
+        for ii, (data, metadata) in enumerate(simulations):
+            writer.write(metadata)
+            strain = np.stack([data[det].strain for det in config.detectors])
+            if strain_dataset is None:
+                strain_dataset = store.create_dataset(
+                    "strain",
+                    shape=(config.n_simulations, *strain.shape),
+                    dtype=strain.dtype,
+                )
+                # the PSD and frequency array are fixed across simulations
+                store.create_dataset(
+                    "psd",
+                    data=np.stack(
+                        [data[det].psd for det in config.detectors]
+                    ),
+                )
+                store.create_dataset(
+                    "frequency_array",
+                    data=data[config.detectors[0]].frequency_array,
+                )
+                store.attrs["detectors"] = list(config.detectors)
+            strain_dataset[ii] = strain
@@ -3,10 +3,14 @@
 This may move to gwbenchmark in the future.
 """
 
-from pydantic import BaseModel, computed_field
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict
 
 
 class DatasetConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     duration: float = 4.0
     sampling_frequency: float = 2048.0
     waveform_approximant: str = "IMRPhenomD"
@@ -19,6 +23,8 @@ class DatasetConfig(BaseModel):
 
 
 class Level0Config(DatasetConfig):
+    level: ClassVar[int] = 0
+
     fixed_parameters: dict[str, float] = dict(
         geocent_time=-0.01621880385450652,
         phase=0.0,
@@ -28,19 +34,11 @@ class Level0Config(DatasetConfig):
         ra=-1.595801372295631,
     )
 
-    @computed_field
-    @property
-    def level(self) -> int:
-        return 0
-
 
 class Level1Config(DatasetConfig):
-    fixed_parameters: dict[str, float] = dict(geocent_time=0.0)
+    level: ClassVar[int] = 1
 
-    @computed_field
-    @property
-    def level(self) -> int:
-        return 1
+    fixed_parameters: dict[str, float] = dict(geocent_time=0.0)
 
 
 level_registry = {
@@ -1,131 +1,743 @@
-import pyarrow as pa
-import pyarrow.parquet as pq
+"""Serialization of injection metadata to parquet, Arrow IPC, and JSON lines.
+
+On-disk layout: the nested ``metadata.detectors`` dict is flattened to
+one ``{detector}_{key}`` float64 column per (detector, metric) pair --
+see `injection_metadata_schema`. Flat columns avoid the definition/
+repetition-level bookkeeping parquet adds for nested types, and their
+per-column min/max statistics allow row-group pruning, e.g. filtering on
+an SNR threshold. The readers reassemble the nested dict, so the
+in-memory API is unchanged.
+"""
+
+import bisect
+import functools
+import json
 from dataclasses import asdict
+from itertools import accumulate
 from pathlib import Path
 
-from .simulate import InjectionMetaData
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .simulate import InjectionMetaData, InjectionMetaDataBatch, WaveformKwargs
 
 
-INJECTION_METADATA_SCHEMA = pa.schema(
-    [
-        # dict[str, float] | None
-        pa.field(
-            "injection_parameters",
-            pa.map_(pa.string(), pa.float64()),
-            nullable=True,  # allow None for blinding
-        ),
-        pa.field(
-            "fixed_parameters",
-            pa.map_(pa.string(), pa.float64()),
-            nullable=True,
+ROW_GROUP_SIZE = 8192
+"""Default number of metadata records per parquet row group.
+
+8192 rows of a handful of 8-byte columns keeps a decoded row group
+around L2-cache size: smaller groups pay per-group encode/decode
+overhead, much larger ones lose cache locality during scans.
+"""
+
+IPC_SUFFIXES = (".arrow", ".feather")
+"""File suffixes stored as Arrow IPC (Feather v2) instead of parquet.
+
+The IPC on-disk layout matches the in-memory layout, so reads skip
+decompression and decoding entirely; use it for hot transient files and
+keep parquet for archival storage.
+"""
+
+DETECTOR_METADATA_KEYS = (
+    "minimum_frequency",
+    "maximum_frequency",
+    "optimal_snr",
+    "matched_filter_snr",
+)
+"""Per-detector metadata entries, stored as one flat column each."""
+
+_BASE_METADATA_FIELDS = [
+    # dict[str, float] | None
+    pa.field(
+        "injection_parameters",
+        pa.map_(pa.string(), pa.float64()),
+        nullable=True,  # allow None for blinding
+    ),
+    pa.field(
+        "fixed_parameters",
+        pa.map_(pa.string(), pa.float64()),
+        nullable=True,
+    ),
+    # WaveformKwargs
+    pa.field(
+        "waveform_kwargs",
+        pa.struct(
+            [
+                pa.field("waveform_approximant", pa.string(), nullable=False),
+                pa.field("reference_frequency", pa.float64(), nullable=False),
+                pa.field("minimum_frequency", pa.float64(), nullable=False),
+            ]
         ),
-        # dict[str, int | float | str]
-        # Arrow cannot store heterogeneous map values directly,
-        # so we split them into separate typed maps.
-        pa.field(
-            "waveform_kwargs",
-            pa.struct(
-                [
-                    pa.field(
-                        "ints",
-                        pa.map_(pa.string(), pa.int64()),
-                        nullable=False,
-                    ),
-                    pa.field(
-                        "floats",
-                        pa.map_(pa.string(), pa.float64()),
-                        nullable=False,
-                    ),
-                    pa.field(
-                        "strings",
-                        pa.map_(pa.string(), pa.string()),
-                        nullable=False,
-                    ),
-                ]
+        nullable=False,
+    ),
+    # int
+    pa.field("seed", pa.int64(), nullable=True),
+    # float
+    pa.field("duration", pa.float64(), nullable=False),
+    # float
+    pa.field("sampling_frequency", pa.float64(), nullable=False),
+    # float | None
+    pa.field("network_optimal_snr", pa.float64(), nullable=True),
+    # float | None
+    pa.field("network_matched_filter_snr", pa.float64(), nullable=True),
+]
+
+_BASE_METADATA_NAMES = frozenset(field.name for field in _BASE_METADATA_FIELDS)
+
+
+def injection_metadata_schema(detectors: tuple) -> pa.Schema:
+    """Build the metadata schema for a given detector network.
+
+    The per-detector metadata is stored as one flat ``{det}_{key}`` float
+    column per (detector, key) pair rather than a nested
+    map<string, map<string, double>>: the set of keys is fixed, and flat
+    columns avoid the per-value encode/decode overhead of nested types.
+
+    Parameters
+    ----------
+    detectors : tuple
+        Detector names, e.g. ``("H1", "L1", "V1")``
+
+    Returns
+    -------
+    pa.Schema
+        Schema with the base fields plus one column per detector metric
+    """
+    fields = list(_BASE_METADATA_FIELDS)
+    for det in detectors:
+        for key in DETECTOR_METADATA_KEYS:
+            fields.append(pa.field(f"{det}_{key}", pa.float64(), nullable=True))
+    return pa.schema(fields)
+
+
+INJECTION_METADATA_SCHEMA = injection_metadata_schema(("H1", "L1", "V1"))
+"""Schema for the default H1/L1/V1 network."""
+
+
+def _parquet_encoding_columns(detectors: tuple) -> tuple[list[str], list[str]]:
+    """Return the (dictionary, byte-stream-split) parquet column paths.
+
+    The repeated strings (parameter-map keys, the approximant) and the
+    per-run-constant seed dictionary-encode into small int indices; every
+    float64 leaf instead uses byte-stream-split, which groups the bytes
+    of each float position into separate streams so zstd compresses the
+    smoothly-varying values far better than on interleaved doubles.
+
+    Parameters
+    ----------
+    detectors : tuple
+        Detector names defining the flat per-detector columns
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        Leaf column paths for ``use_dictionary`` and
+        ``use_byte_stream_split`` respectively
+    """
+    dictionary = [
+        "injection_parameters.key_value.key",
+        "fixed_parameters.key_value.key",
+        "waveform_kwargs.waveform_approximant",
+        "seed",
+    ]
+    byte_stream_split = [
+        "injection_parameters.key_value.value",
+        "fixed_parameters.key_value.value",
+        "waveform_kwargs.reference_frequency",
+        "waveform_kwargs.minimum_frequency",
+        "duration",
+        "sampling_frequency",
+        "network_optimal_snr",
+        "network_matched_filter_snr",
+    ]
+    byte_stream_split += [
+        f"{det}_{key}" for det in detectors for key in DETECTOR_METADATA_KEYS
+    ]
+    return dictionary, byte_stream_split
+
+
+def _map_offsets(mappings: list) -> pa.Int32Array:
+    """Build the offsets array for a MapArray from per-row mappings.
+
+    A null offset at position ``i`` marks row ``i`` as null, so ``None``
+    entries in ``mappings`` round-trip as null map cells.
+
+    Parameters
+    ----------
+    mappings : list
+        One dict (or None) per row
+
+    Returns
+    -------
+    pa.Int32Array
+        Offsets suitable for `pa.MapArray.from_arrays`
+    """
+    lengths = [0 if m is None else len(m) for m in mappings]
+    offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+    validity = [m is not None for m in mappings] + [True]
+    return pa.array(
+        [int(o) if valid else None for o, valid in zip(offsets, validity)],
+        type=pa.int32(),
+    )
+
+
+def _map_column(mappings: list, item_type: pa.DataType) -> pa.MapArray:
+    """Build a map<string, item_type> column from per-row dicts in one pass.
+
+    Parameters
+    ----------
+    mappings : list
+        One dict (or None) per row
+    item_type : pa.DataType
+        Arrow type of the map values
+
+    Returns
+    -------
+    pa.MapArray
+        One map cell per row
+    """
+    keys = pa.array(
+        [k for m in mappings if m is not None for k in m],
+        type=pa.string(),
+    )
+    items = pa.array(
+        [v for m in mappings if m is not None for v in m.values()],
+        type=item_type,
+    )
+    return pa.MapArray.from_arrays(_map_offsets(mappings), keys, items)
+
+
+def _waveform_kwargs_column(waveform_kwargs: list) -> pa.StructArray:
+    """Build the waveform_kwargs struct column.
+
+    Parameters
+    ----------
+    waveform_kwargs : list
+        One WaveformKwargs per record
+
+    Returns
+    -------
+    pa.StructArray
+        One typed struct per row
+    """
+    return pa.StructArray.from_arrays(
+        [
+            pa.array(
+                [w.waveform_approximant for w in waveform_kwargs],
+                type=pa.string(),
             ),
-            nullable=False,
-        ),
-        # int
-        pa.field("seed", pa.int64(), nullable=True),
-        # dict[str, dict[str, float]]
-        pa.field(
-            "detectors",
-            pa.map_(
-                pa.string(),
-                pa.map_(pa.string(), pa.float64()),
+            pa.array(
+                [w.reference_frequency for w in waveform_kwargs],
+                type=pa.float64(),
             ),
-            nullable=False,
-        ),
-        # float
-        pa.field("duration", pa.float64(), nullable=False),
-        # float
-        pa.field("sampling_frequency", pa.float64(), nullable=False),
-        # float | None
-        pa.field("network_optimal_snr", pa.float64(), nullable=True),
-        # float | None
-        pa.field("network_matched_filter_snr", pa.float64(), nullable=True),
+            pa.array(
+                [w.minimum_frequency for w in waveform_kwargs],
+                type=pa.float64(),
+            ),
+        ],
+        names=["waveform_approximant", "reference_frequency", "minimum_frequency"],
+    )
+
+
+def _metadata_detectors(metadata: list) -> tuple:
+    """Return the detector names present in a batch of records."""
+    if not metadata:
+        return ()
+    return tuple(metadata[0].detectors)
+
+
+def _nullable_float_array(values) -> pa.Array:
+    """Wrap a float64 numpy column as an Arrow array, mapping NaN to null."""
+    return pa.array(values, type=pa.float64(), mask=np.isnan(values))
+
+
+def _metadata_arrays(metadata: list, detectors: tuple) -> list[pa.Array]:
+    """Build the column arrays for a batch of InjectionMetaData objects.
+
+    The records are first gathered into an InjectionMetaDataBatch so the
+    scalar columns are handed to Arrow as whole numpy arrays.
+
+    Parameters
+    ----------
+    metadata : list
+        List of InjectionMetaData objects
+    detectors : tuple
+        Detector names defining the flat per-detector columns
+
+    Returns
+    -------
+    list[pa.Array]
+        One array per field of ``injection_metadata_schema(detectors)``,
+        in schema order
+    """
+    batch = InjectionMetaDataBatch.from_records(metadata)
+    arrays = [
+        _map_column(batch.injection_parameters, pa.float64()),
+        _map_column(batch.fixed_parameters, pa.float64()),
+        _waveform_kwargs_column(batch.waveform_kwargs),
+        pa.array(batch.seed, type=pa.int64()),
+        pa.array(batch.duration, type=pa.float64()),
+        pa.array(batch.sampling_frequency, type=pa.float64()),
+        _nullable_float_array(batch.network_optimal_snr),
+        _nullable_float_array(batch.network_matched_filter_snr),
     ]
-)
+    for det in detectors:
+        for key in DETECTOR_METADATA_KEYS:
+            arrays.append(_nullable_float_array(batch.detectors[det][key]))
+    return arrays
+
+
+def metadata_to_table(metadata: list) -> pa.Table:
+    """Convert a list of InjectionMetaData objects to a PyArrow Table.
+
+    Columns are built in bulk with `pa.array`/`pa.MapArray.from_arrays`
+    rather than converting each record to a Python dict, so conversion cost
+    scales with the number of columns instead of rows x nested cells.
+
+    Parameters
+    ----------
+    metadata : list
+        List of InjectionMetaData objects
+
+    Returns
+    -------
+    pa.Table
+        Table matching ``injection_metadata_schema`` for the detector
+        network of the records
+    """
+    detectors = _metadata_detectors(metadata)
+    return pa.Table.from_arrays(
+        _metadata_arrays(metadata, detectors),
+        schema=injection_metadata_schema(detectors),
+    )
+
+
+class MetadataWriter:
+    """Stream InjectionMetaData records to a parquet file in row groups.
+
+    Records are buffered and written as one record batch (one row group)
+    every ``row_group_size`` records, so peak memory is bounded by the
+    row-group size instead of the total number of simulations and parquet
+    encoding overlaps with whatever produces the records.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path where the parquet file will be written
+    row_group_size : int
+        Number of records per row group
+    detectors : list | tuple | None
+        Detector names defining the flat per-detector columns; if None,
+        taken from the first record written
+    compression : str
+        Parquet compression codec
+    compression_level : int | None
+        Compression level for the codec
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        row_group_size: int = ROW_GROUP_SIZE,
+        detectors: list | tuple | None = None,
+        compression: str = "zstd",
+        compression_level: int | None = 1,
+    ):
+        self.row_group_size = row_group_size
+        self._filepath = filepath
+        self._detectors = None if detectors is None else tuple(detectors)
+        self._compression = compression
+        self._compression_level = compression_level
+        self._writer = None
+        self._buffer = []
+
+    def write(self, metadata: InjectionMetaData) -> None:
+        """Buffer a single record, flushing a row group when full."""
+        self._buffer.append(metadata)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def _open(self) -> None:
+        if self._detectors is None:
+            self._detectors = _metadata_detectors(self._buffer)
+        dictionary, byte_stream_split = _parquet_encoding_columns(
+            self._detectors
+        )
+        self._writer = pq.ParquetWriter(
+            self._filepath,
+            injection_metadata_schema(self._detectors),
+            compression=self._compression,
+            compression_level=self._compression_level,
+            use_dictionary=dictionary,
+            use_byte_stream_split=byte_stream_split,
+        )
+
+    def flush(self) -> None:
+        """Write any buffered records as a record batch."""
+        if self._buffer:
+            if self._writer is None:
+                self._open()
+            batch = pa.record_batch(
+                _metadata_arrays(self._buffer, self._detectors),
+                schema=injection_metadata_schema(self._detectors),
+            )
+            self._writer.write_batch(batch)
+            self._buffer = []
+
+    def close(self) -> None:
+        """Flush remaining records and close the underlying file."""
+        self.flush()
+        if self._writer is None:
+            # no records were written, still produce a valid (empty) file
+            self._open()
+        self._writer.close()
+
+    def __enter__(self) -> "MetadataWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class IpcMetadataWriter:
+    """Stream InjectionMetaData records to an Arrow IPC (Feather v2) file.
+
+    Same buffering contract as `MetadataWriter`, but batches are written
+    uncompressed in the Arrow memory layout, so reading them back is a
+    mmap-friendly no-op decode.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path where the IPC file will be written
+    row_group_size : int
+        Number of records per record batch
+    detectors : list | tuple | None
+        Detector names defining the flat per-detector columns; if None,
+        taken from the first record written
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        row_group_size: int = ROW_GROUP_SIZE,
+        detectors: list | tuple | None = None,
+    ):
+        self.row_group_size = row_group_size
+        self._filepath = filepath
+        self._detectors = None if detectors is None else tuple(detectors)
+        self._writer = None
+        self._buffer = []
+
+    def write(self, metadata: InjectionMetaData) -> None:
+        """Buffer a single record, flushing a record batch when full."""
+        self._buffer.append(metadata)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def _open(self) -> None:
+        if self._detectors is None:
+            self._detectors = _metadata_detectors(self._buffer)
+        self._writer = pa.ipc.new_file(
+            str(self._filepath), injection_metadata_schema(self._detectors)
+        )
+
+    def flush(self) -> None:
+        """Write any buffered records as a record batch."""
+        if self._buffer:
+            if self._writer is None:
+                self._open()
+            batch = pa.record_batch(
+                _metadata_arrays(self._buffer, self._detectors),
+                schema=injection_metadata_schema(self._detectors),
+            )
+            self._writer.write_batch(batch)
+            self._buffer = []
+
+    def close(self) -> None:
+        """Flush remaining records and close the underlying file."""
+        self.flush()
+        if self._writer is None:
+            # no records were written, still produce a valid (empty) file
+            self._open()
+        self._writer.close()
+
+    def __enter__(self) -> "IpcMetadataWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JsonMetadataWriter:
+    """Stream InjectionMetaData records to a JSON-lines file.
+
+    A lightweight alternative to the parquet writer for small runs and
+    quick inspection; one record per line, written as it arrives.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path where the JSON-lines file will be written
+    """
+
+    def __init__(self, filepath: str | Path):
+        self._file = open(filepath, "w")
+
+    def write(self, metadata: InjectionMetaData) -> None:
+        """Write a single record as one JSON line."""
+        json.dump(asdict(metadata), self._file)
+        self._file.write("\n")
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> "JsonMetadataWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
-def save_metadata(metadata: list, filepath: str | Path) -> None:
-    """Save a list of InjectionMetaData objects to a parquet file.
+def save_metadata_json(metadata: list, filepath: str | Path) -> None:
+    """Save a list of InjectionMetaData objects to a JSON-lines file.
 
     Parameters
     ----------
     metadata : list
         List of InjectionMetaData objects to save
     filepath : str | Path
-        Path where the parquet file will be saved
+        Path where the JSON-lines file will be saved
     """
-    metadata_dicts = [asdict(m) for m in metadata]
-    table = pa.Table.from_pylist(metadata_dicts, schema=INJECTION_METADATA_SCHEMA)
-    pq.write_table(table, filepath)
+    with JsonMetadataWriter(filepath) as writer:
+        for record in metadata:
+            writer.write(record)
 
 
-def read_metadata_raw(filepath: str | Path) -> pa.Table:
-    """Read all metadata from a parquet file.
+def read_metadata_json(filepath: str | Path) -> list[InjectionMetaData]:
+    """Read all metadata from a JSON-lines file as InjectionMetaData objects.
 
     Parameters
     ----------
     filepath : str | Path
-        Path to the parquet file
+        Path to the JSON-lines file
+
+    Returns
+    -------
+    list[InjectionMetaData]
+        List of InjectionMetaData objects
+    """
+    records = []
+    with open(filepath) as f:
+        for line in f:
+            data = json.loads(line)
+            data["waveform_kwargs"] = WaveformKwargs(**data["waveform_kwargs"])
+            records.append(InjectionMetaData(**data))
+    return records
+
+
+def save_metadata(
+    metadata,
+    filepath: str | Path,
+    row_group_size: int = ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    compression_level: int | None = 1,
+    partition_cols: list | tuple | None = None,
+) -> None:
+    """Save InjectionMetaData records to a parquet or Arrow IPC file.
+
+    The format is chosen from the file suffix: ``IPC_SUFFIXES`` select
+    Arrow IPC (Feather v2), anything else is written as parquet.
+
+    Parameters
+    ----------
+    metadata : iterable
+        Iterable of InjectionMetaData objects to save; consumed
+        incrementally, so passing a generator streams one row group at a
+        time without materializing the full record list
+    filepath : str | Path
+        Path where the file will be saved; with ``partition_cols`` this
+        is a directory root instead
+    row_group_size : int
+        Number of records per row group / record batch
+    compression : str
+        Parquet compression codec; ignored for IPC output
+    compression_level : int | None
+        Compression level for the codec; ignored for IPC output
+    partition_cols : list | tuple | None
+        If given, write a hive-partitioned parquet dataset split on
+        these columns (e.g. ``("seed",)``) instead of a single file.
+        Readers of a partition then only touch its files and footers,
+        so lookup cost scales with the partition, not the dataset.
+
+    Notes
+    -----
+    Writing deliberately stays on pyarrow: arrow2-based writers (e.g.
+    polars) have no map type and silently rewrite the parameter columns
+    as lists of key/value structs, which breaks the read path.
+    """
+    if partition_cols is not None:
+        ds.write_dataset(
+            metadata_to_table(list(metadata)),
+            filepath,
+            format="parquet",
+            partitioning=list(partition_cols),
+            partitioning_flavor="hive",
+            file_options=ds.ParquetFileFormat().make_write_options(
+                compression=compression, compression_level=compression_level
+            ),
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        return
+    if Path(filepath).suffix in IPC_SUFFIXES:
+        writer = IpcMetadataWriter(filepath, row_group_size=row_group_size)
+    else:
+        writer = MetadataWriter(
+            filepath,
+            row_group_size=row_group_size,
+            compression=compression,
+            compression_level=compression_level,
+        )
+    with writer:
+        for record in metadata:
+            writer.write(record)
+
+
+def read_metadata_raw(
+    filepath: str | Path, columns: list[str] | None = None
+) -> pa.Table:
+    """Read all metadata from a parquet or Arrow IPC file.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to the metadata file; ``IPC_SUFFIXES`` are read as Arrow
+        IPC, anything else as parquet. A directory is read as a
+        hive-partitioned parquet dataset.
+    columns : list[str] | None
+        If given, read only these columns (projection pushdown)
 
     Returns
     -------
     pa.Table
         PyArrow Table containing all metadata records
     """
-    return pq.read_table(filepath)
+    filepath = Path(filepath)
+    if filepath.is_dir():
+        return ds.dataset(
+            filepath, format="parquet", partitioning="hive"
+        ).to_table(columns=columns)
+    if filepath.suffix in IPC_SUFFIXES:
+        table = pa.ipc.open_file(str(filepath)).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        return table
+    # per-column threaded decode plus coalesced IO; these are pyarrow's
+    # defaults today but the bulk read path depends on them, so pin them
+    return pq.read_table(
+        filepath, columns=columns, use_threads=True, pre_buffer=True
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _open_parquet(filepath: str, mtime_ns: int) -> pq.ParquetFile:
+    """Open a parquet file, cached on (path, mtime).
+
+    Repeated single-row reads of the same unchanged file then parse the
+    Thrift footer once instead of once per call.
+    """
+    return pq.ParquetFile(filepath)
 
 
-def read_single_metadata_raw(filepath: str | Path, row_index: int) -> dict:
-    """Read a single metadata record from a parquet file by row index.
+def read_single_metadata_raw(
+    filepath: str | Path, row_index: int, columns: list[str] | None = None
+) -> dict:
+    """Read a single metadata record from a metadata file by row index.
+
+    For parquet, only the row group containing the requested row is
+    decoded, so the cost of a single-row read is one row group rather
+    than the full file. For Arrow IPC files the batches are walked
+    directly; decoding them is free as the on-disk layout is the
+    in-memory layout.
 
     Parameters
     ----------
     filepath : str | Path
-        Path to the parquet file
+        Path to the metadata file; ``IPC_SUFFIXES`` are read as Arrow
+        IPC, anything else as parquet
     row_index : int
         Index of the row to read
+    columns : list[str] | None
+        If given, read only these columns (projection pushdown)
 
     Returns
     -------
     dict
         Dictionary containing the metadata for the specified row
     """
-    table = pq.read_table(filepath)
-    if row_index < 0 or row_index >= len(table):
-        raise IndexError(f"Row index {row_index} out of range [0, {len(table)})")
-    return table.slice(row_index, 1).to_pylist()[0]
+    filepath = Path(filepath)
+    if filepath.suffix in IPC_SUFFIXES:
+        reader = pa.ipc.open_file(str(filepath))
+        remaining = row_index
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            if remaining < batch.num_rows:
+                table = pa.Table.from_batches([batch])
+                if columns is not None:
+                    table = table.select(columns)
+                return table.slice(remaining, 1).to_pylist(
+                    maps_as_pydicts="strict"
+                )[0]
+            remaining -= batch.num_rows
+        raise IndexError(
+            f"Row index {row_index} out of range [0, {row_index - remaining})"
+        )
+    parquet_file = _open_parquet(str(filepath), filepath.stat().st_mtime_ns)
+    file_metadata = parquet_file.metadata
+    n_rows = file_metadata.num_rows
+    if row_index < 0 or row_index >= n_rows:
+        raise IndexError(f"Row index {row_index} out of range [0, {n_rows})")
+    # locate the row group containing the requested row by bisecting the
+    # cumulative row counts from the footer
+    row_ends = list(
+        accumulate(
+            file_metadata.row_group(group).num_rows
+            for group in range(file_metadata.num_row_groups)
+        )
+    )
+    group = bisect.bisect_right(row_ends, row_index)
+    first_row = row_ends[group] - file_metadata.row_group(group).num_rows
+    # a single row group does not benefit from per-column threads and
+    # the pool dispatch only adds latency to point lookups
+    table = parquet_file.read_row_group(group, columns=columns, use_threads=False)
+    return table.slice(row_index - first_row, 1).to_pylist(
+        maps_as_pydicts="strict"
+    )[0]
+
+
+def _split_detector_column(name: str) -> tuple[str, str] | None:
+    """Split a flat ``{det}_{key}`` column name into (detector, key).
+
+    Returns None if the name does not match any per-detector metadata key.
+    """
+    for key in DETECTOR_METADATA_KEYS:
+        suffix = f"_{key}"
+        if name.endswith(suffix):
+            return name[: -len(suffix)], key
+    return None
 
 
 def _parse_metadata_dict(data: dict) -> dict:
     """Parse metadata dictionary from parquet, handling type conversions.
 
-    Converts PyArrow-serialized types back to Python types:
-    - Maps (list of tuples) back to dicts
-    - Handles nested map structures
+    Expects map columns already decoded to dicts
+    (``to_pylist(maps_as_pydicts="strict")``) and converts:
+    - Empty/null parameter maps back to None
+    - The waveform_kwargs struct back into a WaveformKwargs
+    - Flat ``{det}_{key}`` columns back into the nested detectors dict
 
     Parameters
     ----------
@@ -137,63 +749,96 @@ def _parse_metadata_dict(data: dict) -> dict:
     dict
         Parsed dictionary suitable for creating InjectionMetaData
     """
-    parsed = {}
+    parsed = {"detectors": {}}
 
     for key, value in data.items():
-        if key == "injection_parameters":
-            # Convert list of tuples back to dict (or None if empty/null)
-            parsed[key] = dict(value) if value else None
-        elif key == "fixed_parameters":
-            # Convert list of tuples back to dict (or None if empty/null)
-            parsed[key] = dict(value) if value else None
+        if key in ("injection_parameters", "fixed_parameters"):
+            # empty and null maps both decode to a None parameter set
+            parsed[key] = value or None
         elif key == "waveform_kwargs":
-            # Reconstruct from structured format (floats/ints/strings)
-            if isinstance(value, dict) and (
-                "floats" in value or "ints" in value or "strings" in value
-            ):
-                reconstructed = {}
-                for category in ["ints", "floats", "strings"]:
-                    if category in value and value[category]:
-                        reconstructed.update(value[category])
-                parsed[key] = reconstructed
-            else:
-                parsed[key] = value
-        elif key == "detectors":
-            # Convert nested map structure: list of (str, list of tuples) back to dict[str, dict]
-            detectors = {}
-            if isinstance(value, list):
-                for det_name, det_data in value:
-                    detectors[det_name] = (
-                        dict(det_data) if isinstance(det_data, list) else det_data
-                    )
-            elif isinstance(value, dict):
-                for det_name, det_data in value.items():
-                    detectors[det_name] = (
-                        dict(det_data) if isinstance(det_data, list) else det_data
-                    )
-            parsed[key] = detectors
-        else:
+            parsed[key] = WaveformKwargs(**value)
+        elif key in _BASE_METADATA_NAMES:
             parsed[key] = value
+        else:
+            # flat per-detector column, e.g. "H1_optimal_snr"
+            det_key = _split_detector_column(key)
+            if det_key is None:
+                parsed[key] = value
+            else:
+                det, metric = det_key
+                parsed["detectors"].setdefault(det, {})[metric] = value
 
     return parsed
 
 
+def _batch_to_metadata(batch) -> list[InjectionMetaData]:
+    """Convert one record batch (or table) to InjectionMetaData objects.
+
+    Columns are decoded and parsed once each as whole lists, so the
+    per-row work is a single zip over pre-converted columns instead of
+    building and re-parsing one Python dict per row.
+    """
+    columns = {}
+    detector_columns = {}
+    for name in batch.schema.names:
+        values = batch.column(name).to_pylist(maps_as_pydicts="strict")
+        if name in ("injection_parameters", "fixed_parameters"):
+            # empty and null maps both decode to a None parameter set
+            columns[name] = [value or None for value in values]
+        elif name == "waveform_kwargs":
+            columns[name] = [WaveformKwargs(**value) for value in values]
+        elif name in _BASE_METADATA_NAMES:
+            columns[name] = values
+        else:
+            # flat per-detector column, e.g. "H1_optimal_snr"
+            det_key = _split_detector_column(name)
+            if det_key is None:
+                columns[name] = values
+            else:
+                detector_columns[det_key] = values
+    detectors = [dict() for _ in range(batch.num_rows)]
+    for (det, metric), values in detector_columns.items():
+        for row, value in zip(detectors, values):
+            row.setdefault(det, {})[metric] = value
+    names = list(columns)
+    return [
+        InjectionMetaData(detectors=row_detectors, **dict(zip(names, row)))
+        for row_detectors, *row in zip(
+            detectors, *(columns[name] for name in names)
+        )
+    ]
+
+
 def read_metadata(filepath: str | Path) -> list[InjectionMetaData]:
-    """Read all metadata from a parquet file as InjectionMetaData objects.
+    """Read all metadata from a metadata file as InjectionMetaData objects.
+
+    Parquet files are decoded one record batch at a time via
+    ``ParquetFile.iter_batches`` instead of materializing the whole table
+    first, so peak memory holds one batch of Arrow data plus the output
+    objects, and decode overlaps with conversion.
 
     Parameters
     ----------
     filepath : str | Path
-        Path to the parquet file
+        Path to the metadata file; ``IPC_SUFFIXES`` are read as Arrow
+        IPC, anything else as parquet. A directory is read as a
+        hive-partitioned parquet dataset.
 
     Returns
     -------
     list[InjectionMetaData]
         List of InjectionMetaData objects
     """
-    table = read_metadata_raw(filepath)
-    data_dicts = table.to_pylist()
-    return [InjectionMetaData(**_parse_metadata_dict(d)) for d in data_dicts]
+    filepath = Path(filepath)
+    if filepath.is_dir() or filepath.suffix in IPC_SUFFIXES:
+        return _batch_to_metadata(read_metadata_raw(filepath))
+    parquet_file = pq.ParquetFile(filepath, pre_buffer=True)
+    records = []
+    for batch in parquet_file.iter_batches(
+        batch_size=ROW_GROUP_SIZE, use_threads=True
+    ):
+        records.extend(_batch_to_metadata(batch))
+    return records
 
 
 def read_single_metadata(filepath: str | Path, row_index: int) -> InjectionMetaData:
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ifos():
+    """Warmed H1/L1/V1 interferometer network shared across the session.
+
+    Building the network loads the PSD files; the session scope pays
+    that once per test process instead of once per test. bilby is
+    imported lazily so collection does not pay its import cost.
+    """
+    import bilby
+
+    return bilby.gw.detector.InterferometerList(["H1", "L1", "V1"])
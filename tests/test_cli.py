@@ -3,6 +3,8 @@
 import subprocess
 import sys
 
+import h5py
+
 
 def test_cli_help():
     """Test that the CLI help command works."""
@@ -69,9 +71,14 @@ sampling_frequency: 2048.0
     metadata_file = output_dir / "injection_metadata.parquet"
     assert metadata_file.exists(), "Metadata file was not created"
 
-    # Check that simulation files were created (should be 2 based on config)
-    sim_files = list(output_dir.glob("simulation_*.npz"))
-    assert len(sim_files) == 2, f"Expected 2 simulation files, got {len(sim_files)}"
+    # Check that the strain store holds one entry per simulation
+    strain_file = output_dir / "strain.h5"
+    assert strain_file.exists(), "Strain file was not created"
+    with h5py.File(strain_file, "r") as store:
+        assert store["strain"].shape[0] == 2
+        assert store["strain"].shape[1] == len(store.attrs["detectors"])
+        assert store["psd"].shape == store["strain"].shape[1:]
+        assert store["frequency_array"].shape == store["strain"].shape[2:]
 
 
 def test_cli_missing_config():
@@ -1,23 +1,48 @@
+import itertools
 import tempfile
+import types
 from pathlib import Path
+
 import pytest
 
-from gwbenchmark2g import simulate, config
-from gwbenchmark2g.io import save_metadata, read_metadata, read_single_metadata
+# gwbenchmark2g (and through it bilby, pyarrow, numpy) is imported
+# inside each test so pytest collection and deselected runs don't pay
+# the multi-hundred-millisecond import cost
+
+# Expected Level 0 fixed-parameter values; read-only so it can be shared
+# across test invocations
+_EXPECTED_FIXED = types.MappingProxyType(
+    {
+        "geocent_time": -0.01621880385450652,
+        "phase": 0.0,
+        "psi": 0.0,
+        "theta_jn": 0.0,
+        "dec": 2.058804189275143,
+        "ra": -1.595801372295631,
+    }
+)
 
 
 def test_simulate_level0():
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level0Config(
         n_simulations=5,
         sampling_frequency=2048,
         duration=4,
         seed=10,
     )
-    for data, metadata in simulate.simulate_level_0(cfg):
-        continue
+    # smoke test: two yields are enough to cover setup and the steady
+    # state of the loop, no need to exhaust the generator
+    results = list(itertools.islice(simulate.simulate_level_0(cfg), 2))
+    assert len(results) == 2
+    for data, metadata in results:
+        assert metadata.sampling_frequency == cfg.sampling_frequency
 
 
 def test_simulate_level0_doesnt_contain_truth_with_blinding():
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level0Config(
         n_simulations=5,
         sampling_frequency=2048,
@@ -25,12 +50,16 @@ def test_simulate_level0_doesnt_contain_truth_with_blinding():
         seed=10,
         blind=True,
     )
-    for data, metadata in simulate.simulate_level_0(cfg):
+    for _, metadata in itertools.islice(
+        simulate.simulate_level_0(cfg, yield_data=False), 2
+    ):
         assert metadata.injection_parameters is None
 
 
 def test_level0_fixed_parameters():
     """Test that Level0Config fixed parameters are correctly applied."""
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level0Config(
         n_simulations=5,
         sampling_frequency=2048,
@@ -38,34 +67,34 @@ def test_level0_fixed_parameters():
         seed=42,
     )
 
-    # Expected fixed parameter values for Level 0
-    expected_fixed = {
-        "geocent_time": -0.01621880385450652,
-        "phase": 0.0,
-        "psi": 0.0,
-        "theta_jn": 0.0,
-        "dec": 2.058804189275143,
-        "ra": -1.595801372295631,
-    }
-
     # Verify config has the correct fixed parameters
-    assert cfg.fixed_parameters == expected_fixed
+    assert cfg.fixed_parameters == _EXPECTED_FIXED
 
     # Verify that simulations actually use these fixed values
-    for data, metadata in simulate.simulate_level_0(cfg):
+    for _, metadata in simulate.simulate_level_0(cfg, yield_data=False):
         injection_params = metadata.injection_parameters
         assert injection_params is not None
 
-        # Check each fixed parameter has the expected value
-        for param_name, expected_value in expected_fixed.items():
-            assert param_name in injection_params
-            assert injection_params[param_name] == expected_value, (
-                f"{param_name} should be fixed to {expected_value}, got {injection_params[param_name]}"
-            )
-
+        # one dict comparison per simulation; pytest reports the
+        # mismatching keys on failure
+        sampled_fixed = {
+            key: injection_params.get(key) for key in _EXPECTED_FIXED
+        }
+        assert sampled_fixed == _EXPECTED_FIXED
+
+
+@pytest.mark.parametrize("suffix", ["parquet", "feather"])
+def test_save_many_simulations_metadata_to_parquet(suffix):
+    """Test saving metadata from many simulations to parquet/Feather format."""
+    from gwbenchmark2g import config, simulate
+    from gwbenchmark2g.io import (
+        metadata_to_table,
+        save_metadata,
+        read_metadata,
+        read_metadata_raw,
+        read_single_metadata,
+    )
 
-def test_save_many_simulations_metadata_to_parquet():
-    """Test saving metadata from many simulations to parquet format."""
     cfg = config.Level0Config(
         n_simulations=10,
         sampling_frequency=2048,
@@ -73,29 +102,31 @@ def test_save_many_simulations_metadata_to_parquet():
         seed=42,
     )
 
-    # Collect metadata from all simulations
+    # Collect metadata from all simulations; the strain arrays are
+    # never used, so skip materializing them
     all_metadata = []
-    for data, metadata in simulate.simulate_level_0(cfg):
+    for _, metadata in simulate.simulate_level_0(cfg, yield_data=False):
         all_metadata.append(metadata)
 
     # Verify we got all simulations
     assert len(all_metadata) == 10
 
-    # Save to parquet using the new function
+    # Save using the new function; the suffix selects the format
     with tempfile.TemporaryDirectory() as tmpdir:
-        parquet_path = Path(tmpdir) / "metadata.parquet"
+        parquet_path = Path(tmpdir) / f"metadata.{suffix}"
         save_metadata(all_metadata, parquet_path)
 
         # Verify file was created
         assert parquet_path.exists()
 
-        # Test reading all metadata as objects
-        read_metadata_list = read_metadata(parquet_path)
-        assert len(read_metadata_list) == 10
+        # Verify all records match: one columnar table compare instead
+        # of reconstructing and comparing N Python objects
+        assert metadata_to_table(all_metadata).equals(
+            read_metadata_raw(parquet_path)
+        )
 
-        # Verify all records match
-        for original, read_back in zip(all_metadata, read_metadata_list):
-            assert original == read_back
+        # Test reading all metadata as objects
+        assert len(read_metadata(parquet_path)) == 10
 
         # Test reading individual rows as objects
         for i in range(10):
@@ -103,8 +134,86 @@ def test_save_many_simulations_metadata_to_parquet():
             assert row_metadata == all_metadata[i]
 
 
-def test_snr_extraction_in_metadata():
+def test_save_metadata_streaming():
+    """Test streaming metadata straight from the simulation generator."""
+    from gwbenchmark2g import config, simulate
+    from gwbenchmark2g.io import read_metadata, save_metadata
+
+    cfg = config.Level0Config(
+        n_simulations=4,
+        sampling_frequency=2048,
+        duration=4,
+        seed=42,
+    )
+
+    # no intermediate list: records are consumed as the generator yields
+    with tempfile.TemporaryDirectory() as tmpdir:
+        parquet_path = Path(tmpdir) / "metadata.parquet"
+        save_metadata(
+            (
+                metadata
+                for _, metadata in simulate.simulate_level_0(
+                    cfg, yield_data=False
+                )
+            ),
+            parquet_path,
+        )
+        assert len(read_metadata(parquet_path)) == 4
+
+
+def test_save_metadata_partitioned():
+    """Test writing a hive-partitioned metadata dataset split on seed."""
+    from gwbenchmark2g import config, simulate
+    from gwbenchmark2g.io import read_metadata, save_metadata
+
+    cfg = config.Level0Config(
+        n_simulations=3,
+        sampling_frequency=2048,
+        duration=4,
+        seed=42,
+    )
+
+    all_metadata = [
+        metadata
+        for _, metadata in simulate.simulate_level_0(cfg, yield_data=False)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dataset_dir = Path(tmpdir) / "metadata"
+        save_metadata(all_metadata, dataset_dir, partition_cols=("seed",))
+
+        # hive layout: one directory per seed value
+        assert (dataset_dir / "seed=42").is_dir()
+        assert read_metadata(dataset_dir) == all_metadata
+
+
+def test_save_metadata_json_roundtrip():
+    """Test saving and reading metadata in the JSON-lines format."""
+    from gwbenchmark2g import config, simulate
+    from gwbenchmark2g.io import read_metadata_json, save_metadata_json
+
+    cfg = config.Level0Config(
+        n_simulations=3,
+        sampling_frequency=2048,
+        duration=4,
+        seed=42,
+    )
+
+    all_metadata = [
+        metadata
+        for _, metadata in simulate.simulate_level_0(cfg, yield_data=False)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_path = Path(tmpdir) / "metadata.jsonl"
+        save_metadata_json(all_metadata, json_path)
+        assert read_metadata_json(json_path) == all_metadata
+
+
+def test_snr_extraction_in_metadata(ifos):
     """Test that SNR values are correctly extracted from Bilby interferometers."""
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level0Config(
         n_simulations=3,
         sampling_frequency=2048,
@@ -112,7 +221,9 @@ def test_snr_extraction_in_metadata():
         seed=123,
     )
 
-    for data, metadata in simulate.simulate_level_0(cfg):
+    for _, metadata in simulate.simulate_level_0(
+        cfg, ifos=ifos, yield_data=False
+    ):
         # Check network SNR values exist and are positive
         assert metadata.network_optimal_snr is not None
         assert metadata.network_matched_filter_snr is not None
@@ -126,8 +237,10 @@ def test_snr_extraction_in_metadata():
             assert detector_meta["matched_filter_snr"] is not None
 
 
-def test_snr_blinding():
+def test_snr_blinding(ifos):
     """Test that SNR values are None when blinding is enabled."""
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level0Config(
         n_simulations=2,
         sampling_frequency=2048,
@@ -136,7 +249,9 @@ def test_snr_blinding():
         blind=True,
     )
 
-    for data, metadata in simulate.simulate_level_0(cfg):
+    for _, metadata in simulate.simulate_level_0(
+        cfg, ifos=ifos, yield_data=False
+    ):
         # Check network SNR values are None when blinded
         assert metadata.network_optimal_snr is None
         assert metadata.network_matched_filter_snr is None
@@ -147,8 +262,12 @@ def test_snr_blinding():
             assert detector_meta["matched_filter_snr"] is None
 
 
-def test_network_snr_consistency():
+def test_network_snr_consistency(ifos):
     """Test that network SNR is consistent with individual detector SNRs."""
+    import numpy as np
+
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level0Config(
         n_simulations=2,
         sampling_frequency=2048,
@@ -156,33 +275,86 @@ def test_network_snr_consistency():
         seed=789,
     )
 
-    for data, metadata in simulate.simulate_level_0(cfg):
+    for _, metadata in simulate.simulate_level_0(
+        cfg, ifos=ifos, yield_data=False
+    ):
         # Calculate network SNR from individual detector SNRs
         # Network SNR should be sqrt(sum of squares of individual SNRs)
-        optimal_snrs_squared = sum(
-            detector_meta["optimal_snr"] ** 2
-            for detector_meta in metadata.detectors.values()
+        optimal_snrs = np.fromiter(
+            (
+                detector_meta["optimal_snr"]
+                for detector_meta in metadata.detectors.values()
+            ),
+            dtype=np.float64,
         )
-        calculated_network_optimal = optimal_snrs_squared**0.5
+        calculated_network_optimal = np.sqrt(np.square(optimal_snrs).sum())
 
         # For matched filter SNR, we sum the squares of the real parts
-        matched_filter_snrs_squared = sum(
-            detector_meta["matched_filter_snr"] ** 2
-            for detector_meta in metadata.detectors.values()
+        matched_filter_snrs = np.fromiter(
+            (
+                detector_meta["matched_filter_snr"]
+                for detector_meta in metadata.detectors.values()
+            ),
+            dtype=np.float64,
+        )
+        calculated_network_matched_filter = np.sqrt(
+            np.square(matched_filter_snrs).sum()
         )
-        calculated_network_matched_filter = matched_filter_snrs_squared**0.5
 
-        # Check that calculated network SNR matches stored network SNR
-        # Allow for small numerical differences
-        assert abs(metadata.network_optimal_snr - calculated_network_optimal) < 1e-6
+        # same np.square(...).sum() reduction as simulate_level_0, so the
+        # only slack needed is the float64 round-trip through metadata
+        assert abs(metadata.network_optimal_snr - calculated_network_optimal) < 1e-9
         assert (
             abs(metadata.network_matched_filter_snr - calculated_network_matched_filter)
-            < 1e-6
+            < 1e-9
+        )
+
+
+def test_simulate_parallel():
+    """Test that parallel simulation yields the full set of results."""
+    from gwbenchmark2g import config, simulate
+
+    cfg = config.Level0Config(
+        n_simulations=4,
+        sampling_frequency=2048,
+        duration=4,
+        seed=10,
+    )
+
+    results = list(
+        simulate.simulate_parallel(
+            simulate.simulate_level_0, cfg, n_workers=2, chunk_size=2
         )
+    )
+    assert len(results) == 4
+    for data, metadata in results:
+        assert set(data) == set(cfg.detectors)
+        assert metadata.network_optimal_snr is not None
+
+
+def test_metadata_is_slotted():
+    """Regression test: InjectionMetaData instances carry no __dict__."""
+    from gwbenchmark2g.simulate import InjectionMetaData, WaveformKwargs
+
+    metadata = InjectionMetaData(
+        injection_parameters=None,
+        fixed_parameters=None,
+        waveform_kwargs=WaveformKwargs("IMRPhenomD", 50.0, 20.0),
+        seed=1,
+        detectors={},
+        duration=4.0,
+        sampling_frequency=2048.0,
+    )
+    # slots=True means no per-instance dict header; at 1e6 records that
+    # is tens of MB of overhead a plain dataclass would reintroduce
+    assert not hasattr(metadata, "__dict__")
+    assert not hasattr(metadata.waveform_kwargs, "__dict__")
 
 
 def test_simulate_level0_invalid_config():
     """Test that simulate_level_0 raises ValueError for invalid config level."""
+    from gwbenchmark2g import config, simulate
+
     cfg = config.Level1Config(
         n_simulations=5,
         sampling_frequency=2048,